@@ -28,11 +28,30 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
-import json
+import functools
 import random
+import re
 import sys
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+# stats I/O: orjson if it happens to be installed (faster, speaks bytes), stdlib otherwise
+try:
+    import orjson
+
+    def _json_loads(raw: bytes) -> dict:
+        return orjson.loads(raw)
+
+    def _json_dumps(data: dict) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+
+    def _json_loads(raw: bytes) -> dict:
+        return json.loads(raw)
+
+    def _json_dumps(data: dict) -> bytes:
+        return json.dumps(data, indent=2).encode("utf-8")
 
 # ——— mini built-in wordlists ———
 # keep the repo lightweight; toss in your own txts for a bigger pool
@@ -58,10 +77,35 @@ class Ansi:
     BLUE = "\033[34m"; MAGENTA = "\033[35m"; CYAN = "\033[36m"; WHITE = "\033[37m"
     BG_GREEN = "\033[42m"; BG_YELLOW = "\033[43m"; BG_GREY = "\033[100m"
 
-# status codes -> easier to style downstream
-STATUS = {"correct": "G", "present": "Y", "absent": "B"}
-EMOJI = {"G": "🟩", "Y": "🟨", "B": "⬛"}
+# status codes -> small ints, so a scored row is just 5 bytes; higher = better,
+# which is all the keyboard heatmap needs to keep the best status per letter
+STATUS_B, STATUS_Y, STATUS_G = 0, 1, 2
+STATUS = {"correct": STATUS_G, "present": STATUS_Y, "absent": STATUS_B}
+EMOJI = ("⬛", "🟨", "🟩")  # indexed by status code
 QWERTY_ROWS = ["QWERTYUIOP", "ASDFGHJKL", "ZXCVBNM"]
+# exactly 5 ascii letters; one C-level match instead of len/isascii/isalpha calls
+_WORD_RE = re.compile(r"[a-z]{5}\Z")
+# same rule for a whole wordlist file at once: one 5-letter word per line, padding ok
+_WORDLIST_RE = re.compile(rb"^[ \t\r\f\v]*([a-z]{5})[ \t\r\f\v]*$", re.MULTILINE)
+# daily mode anchor, random-ish date around Wordle’s rise; kept as a plain day number
+_EPOCH_ORDINAL = dt.date(2021, 6, 19).toordinal()
+
+# stdout won't turn into (or stop being) a terminal mid-run; ask once
+_IS_TTY = sys.stdout.isatty()
+
+# untouched board row; never changes, so build it once
+_EMPTY_ROW = "   ".join(["[ _ ]"] * 5)
+
+# pre-baked ANSI tiles: 26 letters x 3 statuses, built once instead of per redraw
+_STYLE_BG = {STATUS_G: Ansi.BG_GREEN, STATUS_Y: Ansi.BG_YELLOW, STATUS_B: Ansi.BG_GREY}
+_CELL_CACHE: Dict[Tuple[str, int], str] = {
+    (ch, s): f"{bg}{Ansi.WHITE} {ch.upper()} {Ansi.RESET}"
+    for ch in "abcdefghijklmnopqrstuvwxyz" for s, bg in _STYLE_BG.items()
+}
+_KEY_CACHE: Dict[Tuple[str, int], str] = {
+    (ch, s): f"{bg}{Ansi.WHITE}{ch}{Ansi.RESET}"
+    for ch in "ABCDEFGHIJKLMNOPQRSTUVWXYZ" for s, bg in _STYLE_BG.items()
+}
 
 # ——— helpers ———
 
@@ -69,88 +113,123 @@ def normalize_word(w: str) -> str:
     # chill: trim and lowercase; caps lock won’t carry you
     return w.strip().lower()
 
-def load_words(paths: List[Path]) -> Tuple[List[str], List[str]]:
-    """load (solutions, allowed) from optional files; default to built-ins"""
-    solutions: List[str] = []
-    allowed: List[str] = []
+def load_words(paths: List[Path]) -> Tuple[bytes, FrozenSet[bytes]]:
+    """load (solutions, allowed) from optional files; default to built-ins
+
+    solutions come back packed into one ascii buffer, 5 bytes per word
+    (word i lives at [i*5:(i+1)*5]); allowed is a set of 5-byte words
+    """
+    solutions: List[bytes] = []
+    allowed: List[bytes] = []
 
     for p in paths:
         if not p:
             continue
         if p.exists():
-            with p.open("r", encoding="utf-8") as f:
-                words = [normalize_word(x) for x in f if x.strip()]
-            # only clean 5-letter alpha words, no cursed inputs
-            words = [w for w in words if len(w) == 5 and w.isalpha()]
             # filename vibe check: 'solutions' = answer pool, everything else = allowed guesses
-            if "solution" in p.name.lower():
-                solutions.extend(words)
-            else:
-                allowed.extend(words)
+            bucket = solutions if "solution" in p.name.lower() else allowed
+            # only clean 5-letter alpha words, no cursed inputs; lowercasing and
+            # filtering run over the raw file in C, no per-line python work
+            bucket.extend(_WORDLIST_RE.findall(p.read_bytes().lower()))
 
     if not solutions:
-        solutions = BUILTIN_SOLUTIONS[:]
+        solutions = [w.encode("ascii") for w in BUILTIN_SOLUTIONS]
     if not allowed:
-        allowed = list({*BUILTIN_GUESSES, *solutions})
-
-    # keep order, drop dupes — deterministic ftw
-    def dedup(seq: Iterable[str]) -> List[str]:
-        seen = set(); out = []
-        for x in seq:
-            if x not in seen:
-                seen.add(x); out.append(x)
-        return out
+        allowed = [w.encode("ascii") for w in BUILTIN_GUESSES] + solutions
 
-    return dedup(solutions), dedup(allowed)
+    # keep order, drop dupes — deterministic ftw (dict keeps insertion order)
+    solutions_buf = b"".join(dict.fromkeys(solutions))
+    # allowed is only ever used for membership checks -> frozenset, O(1) lookups
+    return solutions_buf, frozenset(allowed)
 
-def pick_target(solutions: List[str], daily: bool, seed: Optional[int]) -> str:
+def pick_target(solutions: bytes, daily: bool, seed: Optional[int]) -> bytes:
     # daily = deterministic by date (UTC); same puzzle for everyone that day
+    n_solutions = len(solutions) // 5
     if daily:
-        today = dt.date.today()
-        epoch = dt.date(2021, 6, 19)  # random-ish anchor around Wordle’s rise
-        idx = (today - epoch).days % len(solutions)
-        return solutions[idx]
-    rng = random.Random(seed) if seed is not None else random.Random()
-    return rng.choice(solutions)
-
-def score_guess(guess: str, target: str) -> List[str]:
-    """classic green/yellow/black scoring with proper duplicate handling"""
-    guess = guess.lower(); target = target.lower()
-    status = ["B"] * 5
-    leftover: Dict[str, int] = {}
-
-    # pass 1: greens + count leftovers from target
-    for i, (g, t) in enumerate(zip(guess, target)):
-        if g == t:
-            status[i] = "G"
-        else:
-            leftover[t] = leftover.get(t, 0) + 1
+        idx = (dt.date.today().toordinal() - _EPOCH_ORDINAL) % n_solutions
+    else:
+        rng = random.Random(seed) if seed is not None else random.Random()
+        idx = rng.randrange(n_solutions)
+    return solutions[idx * 5:(idx + 1) * 5]
+
+@functools.lru_cache(maxsize=4096)
+def target_profile(target: bytes) -> Tuple[bytes, int]:
+    """per-letter counts (index ord(c) - 97) + 26-bit letter mask of a target"""
+    counts = bytearray(26)
+    mask = 0
+    for b in target:
+        counts[b - 97] += 1
+        mask |= 1 << (b - 97)
+    return bytes(counts), mask
+
+def score_guess(guess: bytes, target: bytes, target_counts: bytes, target_mask: int) -> bytes:
+    """classic green/yellow/black scoring with proper duplicate handling
+
+    works on lowercase ascii bytes; target_counts = per-letter counts of target
+    (index ord(c) - 97), target_mask = same letters as a 26-bit set. both are
+    built once per game so each guess only copies 26 bytes. returns 5 status codes
+    """
+    # fast path: no repeated letters in the guess -> nothing to ration,
+    # a non-green letter is yellow iff the target has it at all
+    seen = 0
+    for g in guess:
+        bit = 1 << (g - 97)
+        if seen & bit:
+            break
+        seen |= bit
+    else:
+        return bytes([STATUS_G if g == t else STATUS_Y if (1 << (g - 97)) & target_mask else STATUS_B
+                      for g, t in zip(guess, target)])
+
+    status = bytearray(5)  # all STATUS_B
+    leftover = bytearray(target_counts)
+
+    # pass 1: greens eat their letter from the leftover pool
+    for i in range(5):
+        g = guess[i]
+        if g == target[i]:
+            status[i] = STATUS_G
+            leftover[g - 97] -= 1
 
     # pass 2: yellows if the letter still has remaining count
-    for i, g in enumerate(guess):
-        if status[i] == "G":
+    for i in range(5):
+        if status[i] == STATUS_G:
             continue
-        if leftover.get(g, 0) > 0:
-            status[i] = "Y"
+        g = guess[i] - 97
+        if leftover[g] > 0:
+            status[i] = STATUS_Y
             leftover[g] -= 1
-    return status
-
-def enforce_hard_mode(guesses: List[str], statuses: List[List[str]], candidate: str) -> Tuple[bool, str]:
-    """Hard Mode rules: lock greens; include revealed letters (with counts)."""
-    candidate = candidate.lower()
-    must_have_counts: Dict[str, int] = {}
-    locked_positions: Dict[int, str] = {}
-
-    for guess, st in zip(guesses, statuses):
-        for i, (ch, s) in enumerate(zip(guess, st)):
-            if s == "G":
-                locked_positions[i] = ch
-            if s in ("G", "Y"):
-                have = sum(1 for a, b in zip(guess, st) if a == ch and b in ("G", "Y"))
-                must_have_counts[ch] = max(must_have_counts.get(ch, 0), have)
-
-    for pos, ch in locked_positions.items():
-        if candidate[pos] != ch:
+    return bytes(status)
+
+@functools.lru_cache(maxsize=65536)
+def score_pair(guess: bytes, target: bytes) -> bytes:
+    """memoized score_guess for callers that don't keep a target profile around;
+    repeated (guess, target) pairs — replays, solver sweeps — become a lookup"""
+    return score_guess(guess, target, *target_profile(target))
+
+def score_batch(guess: bytes, targets: bytes) -> bytes:
+    """score one guess against a packed buffer of targets (5 bytes each, like
+    the solutions buffer); statuses come back packed the same way"""
+    return b"".join(score_pair(guess, targets[i:i + 5]) for i in range(0, len(targets), 5))
+
+def update_hard_mode(locked: List[Optional[str]], must_have_counts: Dict[str, int], guess: str, st: bytes):
+    """fold one scored guess into the running Hard Mode constraints (in place)"""
+    revealed: Dict[str, int] = {}
+    for i, (ch, s) in enumerate(zip(guess, st)):
+        if s == STATUS_G:
+            locked[i] = ch
+        if s != STATUS_B:
+            revealed[ch] = revealed.get(ch, 0) + 1
+    for ch, have in revealed.items():
+        must_have_counts[ch] = max(must_have_counts.get(ch, 0), have)
+
+def enforce_hard_mode(locked: List[Optional[str]], must_have_counts: Dict[str, int], candidate: str) -> Tuple[bool, str]:
+    """Hard Mode rules: lock greens; include revealed letters (with counts).
+
+    candidate is expected already normalized (lowercase), like every guess
+    """
+    for pos, ch in enumerate(locked):
+        if ch is not None and candidate[pos] != ch:
             return False, f"Hard mode: position {pos+1} must be '{ch.upper()}'."
 
     for ch, cnt in must_have_counts.items():
@@ -159,47 +238,41 @@ def enforce_hard_mode(guesses: List[str], statuses: List[List[str]], candidate:
 
     return True, ""
 
-def print_board(guesses: List[str], statuses: List[List[str]], use_color: bool, emoji_mode: bool):
-    # renders the rows — ANSI blocks or emoji squares; both cozy
-    def cell(ch: str, s: str) -> str:
-        if emoji_mode or not use_color:
-            return EMOJI[s]
-        if s == "G":
-            return f"{Ansi.BG_GREEN}{Ansi.WHITE} {ch.upper()} {Ansi.RESET}"
-        if s == "Y":
-            return f"{Ansi.BG_YELLOW}{Ansi.WHITE} {ch.upper()} {Ansi.RESET}"
-        return f"{Ansi.BG_GREY}{Ansi.WHITE} {ch.upper()} {Ansi.RESET}"
-
-    for guess, st in zip(guesses, statuses):
-        if not guess:
-            print("   ".join(["[ _ ]"] * 5))
-        else:
-            print(" ".join(cell(ch, s) for ch, s in zip(guess, st)))
-
-def print_keyboard(guesses: List[str], statuses: List[List[str]], use_color: bool, emoji_mode: bool):
-    # quick keyboard heatmap so your brain keeps up
-    best: Dict[str, str] = {}
-    order = {"B": 0, "Y": 1, "G": 2}
-    for guess, st in zip(guesses, statuses):
-        for ch, s in zip(guess.upper(), st):
-            if ch not in best or order[s] > order[best[ch]]:
-                best[ch] = s
+# board + keyboard renderers come in two flavors — ANSI blocks or emoji squares,
+# both cozy. play_one_game picks one pair up front so no tile re-checks the mode
 
+def _render_board_ansi(guesses: List[str], statuses: List[bytes], empty_rows: int) -> str:
+    rows = [" ".join(_CELL_CACHE[(ch, s)] for ch, s in zip(guess, st)) for guess, st in zip(guesses, statuses)]
+    rows.extend([_EMPTY_ROW] * empty_rows)
+    return "\n".join(rows)
+
+def _render_board_emoji(guesses: List[str], statuses: List[bytes], empty_rows: int) -> str:
+    rows = [" ".join(EMOJI[s] for s in st) for st in statuses]
+    rows.extend([_EMPTY_ROW] * empty_rows)
+    return "\n".join(rows)
+
+def update_keyboard(best: Dict[str, int], guess: str, st: bytes):
+    """merge one scored guess into the keyboard heatmap (in place); G > Y > B"""
+    # .upper() happens here, once per scored guess — keys line up with QWERTY_ROWS
+    for ch, s in zip(guess.upper(), st):
+        if s > best.get(ch, -1):
+            best[ch] = s
+
+# quick keyboard heatmap so your brain keeps up; trailing newline = lil' spacer
+
+def _render_keyboard_ansi(best: Dict[str, int]) -> str:
+    def style_key(ch: str) -> str:
+        s = best.get(ch)
+        return ch if s is None else _KEY_CACHE[(ch, s)]
+
+    return "\n".join(" ".join(style_key(c) for c in row) for row in QWERTY_ROWS) + "\n"
+
+def _render_keyboard_emoji(best: Dict[str, int]) -> str:
     def style_key(ch: str) -> str:
         s = best.get(ch)
-        if s is None:
-            return ch
-        if emoji_mode or not use_color:
-            return {"G":"🟩","Y":"🟨","B":"⬛"}[s] + ch
-        if s == "G":
-            return f"{Ansi.BG_GREEN}{Ansi.WHITE}{ch}{Ansi.RESET}"
-        if s == "Y":
-            return f"{Ansi.BG_YELLOW}{Ansi.WHITE}{ch}{Ansi.RESET}"
-        return f"{Ansi.BG_GREY}{Ansi.WHITE}{ch}{Ansi.RESET}"
-
-    for row in QWERTY_ROWS:
-        print(" ".join(style_key(c) for c in row))
-    print()  # lil' spacer
+        return ch if s is None else EMOJI[s] + ch
+
+    return "\n".join(" ".join(style_key(c) for c in row) for row in QWERTY_ROWS) + "\n"
 
 def save_stats(win: bool, guesses_used: Optional[int]):
     # tiny JSON in your home dir; if it borks, we fail soft
@@ -214,7 +287,7 @@ def save_stats(win: bool, guesses_used: Optional[int]):
     }
     if path.exists():
         try:
-            data.update(json.loads(path.read_text()))
+            data.update(_json_loads(path.read_bytes()))
         except Exception:
             pass  # not worth crashing the vibe
 
@@ -231,7 +304,7 @@ def save_stats(win: bool, guesses_used: Optional[int]):
         data["current_streak"] = 0
 
     try:
-        path.write_text(json.dumps(data, indent=2))
+        path.write_bytes(_json_dumps(data))
     except Exception:
         pass
 
@@ -250,7 +323,7 @@ def print_stats(data: Dict[str, int]):
         bar = "#" * n
         print(f" {i}: {bar}")
 
-def make_share_text(title: str, statuses: List[List[str]]) -> str:
+def make_share_text(title: str, statuses: List[bytes]) -> str:
     # build the little grid you can paste anywhere (always emoji for share)
     lines = []
     for st in statuses:
@@ -260,10 +333,18 @@ def make_share_text(title: str, statuses: List[List[str]]) -> str:
 
 # ——— one game session ———
 
-def play_one_game(solutions: List[str], allowed: List[str], args) -> None:
-    use_color = not args.no_color and not args.emoji and sys.stdout.isatty()
+def play_one_game(solutions: bytes, allowed: FrozenSet[bytes], args) -> None:
+    use_color = not args.no_color and not args.emoji and _IS_TTY
+
+    # mode never changes mid-game -> bind the renderers once
+    if use_color:
+        render_board, render_keyboard = _render_board_ansi, _render_keyboard_ansi
+    else:
+        render_board, render_keyboard = _render_board_emoji, _render_keyboard_emoji
 
     target = pick_target(solutions, daily=args.daily, seed=args.seed)
+    # target is fixed for the whole game -> count its letters once, not per guess
+    target_counts, target_mask = target_profile(target)
 
     title = "Wordle-T (6)"
     if args.daily:
@@ -277,14 +358,24 @@ def play_one_game(solutions: List[str], allowed: List[str], args) -> None:
     print("Type a 5-letter word. Enter to submit. Ctrl+C to quit.\n")
 
     guesses: List[str] = []
-    statuses: List[List[str]] = []
+    statuses: List[bytes] = []
+    # hard mode constraints, updated once per scored guess instead of replayed
+    locked: List[Optional[str]] = [None] * 5
+    must_have_counts: Dict[str, int] = {}
+    # keyboard heatmap, same deal: merge each new guess, never rescan history
+    best: Dict[str, int] = {}
+
+    def redraw(empty_rows: int = 0):
+        # one write per redraw instead of a print per line; slow terminals say thx
+        board = render_board(guesses, statuses, empty_rows)
+        kb = render_keyboard(best)
+        sys.stdout.write(board + "\n" + kb + "\n")
+        sys.stdout.flush()
 
     MAX_GUESSES = 6
     while len(guesses) < MAX_GUESSES:
         # draw board + keyboard each turn so you see the whole picture
-        placeholders = [""] * (MAX_GUESSES - len(guesses))
-        print_board(guesses + placeholders, statuses + [[] for _ in placeholders], use_color, args.emoji)
-        print_keyboard(guesses, statuses, use_color, args.emoji)
+        redraw(MAX_GUESSES - len(guesses))
 
         try:
             raw = input(f"Guess {len(guesses)+1}/{MAX_GUESSES}: ")
@@ -293,25 +384,28 @@ def play_one_game(solutions: List[str], allowed: List[str], args) -> None:
             return
 
         guess = normalize_word(raw)
-        if len(guess) != 5 or not guess.isalpha():
+        if not _WORD_RE.match(guess):
             print("Please enter a valid 5-letter word.\n")
             continue
-        if guess not in allowed:
+        guess_bytes = guess.encode("ascii")
+        if guess_bytes not in allowed:
             print("Word not in list (add it to words.txt to allow).\n")
             continue
         if args.hard:
-            ok, reason = enforce_hard_mode(guesses, statuses, guess)
+            ok, reason = enforce_hard_mode(locked, must_have_counts, guess)
             if not ok:
                 print(reason + "\n")
                 continue
 
-        st = score_guess(guess, target)
+        st = score_guess(guess_bytes, target, target_counts, target_mask)
         guesses.append(guess)
         statuses.append(st)
+        update_keyboard(best, guess, st)
+        if args.hard:
+            update_hard_mode(locked, must_have_counts, guess, st)
 
-        if guess == target:
-            print_board(guesses, statuses, use_color, args.emoji)
-            print_keyboard(guesses, statuses, use_color, args.emoji)
+        if guess_bytes == target:
+            redraw()
             print(Ansi.GREEN + Ansi.BOLD + f"✅ You win in {len(guesses)}/{MAX_GUESSES}!" + Ansi.RESET)
             data = save_stats(True, len(guesses))
             print_stats(data)
@@ -320,9 +414,8 @@ def play_one_game(solutions: List[str], allowed: List[str], args) -> None:
             return
 
     # out of tries — still love u tho
-    print_board(guesses, statuses, use_color, args.emoji)
-    print_keyboard(guesses, statuses, use_color, args.emoji)
-    print(Ansi.RED + Ansi.BOLD + f"❌ You lose. The word was: {target.upper()}" + Ansi.RESET)
+    redraw()
+    print(Ansi.RED + Ansi.BOLD + f"❌ You lose. The word was: {target.decode('ascii').upper()}" + Ansi.RESET)
     data = save_stats(False, None)
     print_stats(data)
     print("\nShare:")